@@ -2,15 +2,21 @@
 
 import pytest
 from pathlib import Path
-import tempfile
 import json
 
 
-@pytest.fixture
-def tmp_dir():
-    """Create a temporary directory for tests."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        yield Path(tmpdir)
+@pytest.fixture(scope="session")
+def cli_command():
+    """Return the Click command for the CLI app, built once per session."""
+    from typer.main import get_command
+    from whosspr.cli import app
+    return get_command(app)
+
+
+@pytest.fixture(scope="module")
+def tmp_dir_module(tmp_path_factory):
+    """Temporary directory shared by a module's tests that never write to it."""
+    return tmp_path_factory.mktemp("shared")
 
 
 @pytest.fixture
@@ -43,9 +49,9 @@ def sample_config_data():
 
 
 @pytest.fixture
-def config_file(tmp_dir, sample_config_data):
+def config_file(tmp_path, sample_config_data):
     """Create a temporary config file."""
-    config_path = tmp_dir / "whosspr.json"
+    config_path = tmp_path / "whosspr.json"
     with open(config_path, "w") as f:
         json.dump(sample_config_data, f)
     return config_path
@@ -1,29 +1,48 @@
 """Tests for whosspr.cli module."""
 
+from contextlib import ExitStack
+from types import SimpleNamespace
+
 import pytest
 from unittest.mock import patch, MagicMock
-from typer.testing import CliRunner
+from click.testing import CliRunner
 from pathlib import Path
 
-from whosspr.cli import app
+from whosspr.config import create_default_config, save_config
+from whosspr.permissions import PermissionStatus
 from whosspr import __version__
 
 
 runner = CliRunner()
 
 
+@pytest.fixture
+def start_env():
+    """Patch what `start` touches; permissions granted, controller fails to start."""
+    with ExitStack() as stack:
+        check_all = stack.enter_context(patch("whosspr.permissions.check_all"))
+        controller = stack.enter_context(patch("whosspr.controller.DictationController"))
+        check_all.return_value = {
+            "microphone": PermissionStatus.GRANTED,
+            "accessibility": PermissionStatus.GRANTED,
+        }
+        # A failing start() keeps the command from entering its run loop
+        controller.return_value.start.return_value = False
+        yield SimpleNamespace(check_all=check_all, controller=controller)
+
+
 class TestVersionCommand:
     """Tests for version option."""
     
-    def test_version_flag(self):
+    def test_version_flag(self, cli_command):
         """Test --version flag."""
-        result = runner.invoke(app, ["--version"])
+        result = runner.invoke(cli_command, ["--version"])
         assert result.exit_code == 0
         assert __version__ in result.stdout
     
-    def test_version_short_flag(self):
+    def test_version_short_flag(self, cli_command):
         """Test -v flag."""
-        result = runner.invoke(app, ["-v"])
+        result = runner.invoke(cli_command, ["-v"])
         assert result.exit_code == 0
         assert "WhOSSpr Flow version" in result.stdout
 
@@ -31,29 +50,27 @@ class TestVersionCommand:
 class TestCheckCommand:
     """Tests for check command."""
     
-    @patch("whosspr.cli.check_all")
-    def test_check_all_granted(self, mock_check):
+    @patch("whosspr.permissions.check_all")
+    def test_check_all_granted(self, mock_check, cli_command):
         """Test check when all permissions granted."""
-        from whosspr.permissions import PermissionStatus
         mock_check.return_value = {
             "microphone": PermissionStatus.GRANTED,
             "accessibility": PermissionStatus.GRANTED,
         }
         
-        result = runner.invoke(app, ["check"])
+        result = runner.invoke(cli_command, ["check"])
         assert result.exit_code == 0
         assert "All permissions granted" in result.stdout
     
-    @patch("whosspr.cli.check_all")
-    def test_check_denied(self, mock_check):
+    @patch("whosspr.permissions.check_all")
+    def test_check_denied(self, mock_check, cli_command):
         """Test check with denied permissions."""
-        from whosspr.permissions import PermissionStatus
         mock_check.return_value = {
             "microphone": PermissionStatus.DENIED,
             "accessibility": PermissionStatus.GRANTED,
         }
         
-        result = runner.invoke(app, ["check"])
+        result = runner.invoke(cli_command, ["check"])
         assert result.exit_code == 0
         assert "Denied" in result.stdout
 
@@ -61,18 +78,18 @@ class TestCheckCommand:
 class TestConfigCommand:
     """Tests for config command."""
     
-    def test_config_show(self, tmp_path):
+    def test_config_show(self, tmp_path, cli_command):
         """Test showing config."""
-        result = runner.invoke(app, ["config", "--show"])
+        result = runner.invoke(cli_command, ["config", "--show"])
         assert result.exit_code == 0
         assert "Model" in result.stdout
         assert "Language" in result.stdout
     
-    def test_config_init(self, tmp_path):
+    def test_config_init(self, tmp_path, cli_command):
         """Test creating config file."""
         config_file = tmp_path / "test.json"
         
-        result = runner.invoke(app, ["config", "--init", "--path", str(config_file)])
+        result = runner.invoke(cli_command, ["config", "--init", "--path", str(config_file)])
         assert result.exit_code == 0
         assert config_file.exists()
         assert "Created" in result.stdout
@@ -81,9 +98,9 @@ class TestConfigCommand:
 class TestModelsCommand:
     """Tests for models command."""
     
-    def test_models_list(self):
+    def test_models_list(self, cli_command):
         """Test listing models."""
-        result = runner.invoke(app, ["models"])
+        result = runner.invoke(cli_command, ["models"])
         assert result.exit_code == 0
         assert "tiny" in result.stdout
         assert "base" in result.stdout
@@ -94,96 +111,72 @@ class TestModelsCommand:
 class TestStartCommand:
     """Tests for start command (mocked)."""
     
-    @patch("whosspr.cli.DictationController")
-    @patch("whosspr.cli.check_all")
-    def test_start_missing_permissions_decline(self, mock_perms, mock_controller):
+    def test_start_missing_permissions_decline(self, start_env, cli_command):
         """Test start with missing permissions, user declines."""
-        from whosspr.permissions import PermissionStatus
-        mock_perms.return_value = {
-            "microphone": PermissionStatus.DENIED,
-            "accessibility": PermissionStatus.GRANTED,
-        }
+        start_env.check_all.return_value["microphone"] = PermissionStatus.DENIED
         
-        result = runner.invoke(app, ["start"], input="n\n")
+        result = runner.invoke(cli_command, ["start"], input="n\n")
         assert result.exit_code == 1
     
-    @patch("whosspr.cli.DictationController")
-    @patch("whosspr.cli.check_all")
-    def test_start_skip_permission_check(self, mock_perms, mock_controller):
+    def test_start_skip_permission_check(self, start_env, cli_command):
         """Test start with --skip-permission-check."""
-        from whosspr.permissions import PermissionStatus
-        mock_perms.return_value = {
+        start_env.check_all.return_value = {
             "microphone": PermissionStatus.DENIED,
             "accessibility": PermissionStatus.DENIED,
         }
         
-        # Make controller.start() fail so we don't enter infinite loop
-        mock_controller.return_value.start.return_value = False
-        
-        result = runner.invoke(app, ["start", "--skip-permission-check"])
+        result = runner.invoke(cli_command, ["start", "--skip-permission-check"])
         
         # Should not call check_all when skipping
         # Controller start fails, but permissions were skipped
-        assert mock_controller.called
+        assert start_env.controller.called
     
-    @patch("whosspr.cli.DictationController")
-    @patch("whosspr.cli.check_all")
-    def test_start_invalid_model(self, mock_perms, mock_controller):
+    def test_start_invalid_model(self, start_env, cli_command):
         """Test start with invalid model."""
-        from whosspr.permissions import PermissionStatus
-        mock_perms.return_value = {
-            "microphone": PermissionStatus.GRANTED,
-            "accessibility": PermissionStatus.GRANTED,
-        }
-        
-        result = runner.invoke(app, ["start", "--model", "invalid-model"])
+        result = runner.invoke(cli_command, ["start", "--model", "invalid-model"])
         assert result.exit_code == 1
         assert "Invalid model" in result.stdout
     
-    @patch("whosspr.cli.DictationController")
-    @patch("whosspr.cli.check_all")
-    def test_start_with_config_file(self, mock_perms, mock_controller, tmp_path):
+    def test_start_with_config_file(self, start_env, tmp_path, cli_command):
         """Test start with config file."""
-        from whosspr.permissions import PermissionStatus
-        from whosspr.config import create_default_config, save_config
-        
-        mock_perms.return_value = {
-            "microphone": PermissionStatus.GRANTED,
-            "accessibility": PermissionStatus.GRANTED,
-        }
-        mock_controller.return_value.start.return_value = False
-        
         # Create config
         config_file = tmp_path / "config.json"
         cfg = create_default_config()
         save_config(cfg, str(config_file))
         
-        result = runner.invoke(app, ["start", "--config", str(config_file)])
+        result = runner.invoke(cli_command, ["start", "--config", str(config_file)])
+        
+        assert start_env.controller.called
+    
+    def test_start_chunk_size(self, start_env, cli_command):
+        """Test --chunk-size reaches the controller config."""
+        runner.invoke(cli_command, ["start", "--skip-permission-check", "--chunk-size", "512"])
         
-        assert mock_controller.called
+        config = start_env.controller.call_args.args[0]
+        assert config.audio.chunk_size == 512
+    
+    def test_start_invalid_chunk_size(self, start_env, cli_command):
+        """Test --chunk-size rejects non-positive values."""
+        result = runner.invoke(cli_command, ["start", "--chunk-size", "0"])
+        
+        assert result.exit_code == 2
+        assert not start_env.controller.called
 
 
 class TestHelpOutput:
     """Tests for help output."""
     
-    def test_main_help(self):
-        """Test main help."""
-        result = runner.invoke(app, ["--help"])
-        assert result.exit_code == 0
-        assert "WhOSSpr Flow" in result.stdout
-    
-    def test_start_help(self):
-        """Test start command help."""
-        result = runner.invoke(app, ["start", "--help"])
-        assert result.exit_code == 0
-        assert "config" in result.stdout
-        assert "model" in result.stdout
-    
-    def test_check_help(self):
-        """Test check command help."""
-        result = runner.invoke(app, ["check", "--help"])
+    @pytest.mark.parametrize("args, expected", [
+        (["--help"], ["WhOSSpr Flow"]),
+        (["start", "--help"], ["config", "model"]),
+        (["check", "--help"], ["permissions"]),
+    ], ids=["main", "start", "check"])
+    def test_help(self, cli_command, args, expected):
+        """Test help output for the app and its commands."""
+        result = runner.invoke(cli_command, args)
         assert result.exit_code == 0
-        assert "permissions" in result.stdout
+        for text in expected:
+            assert text in result.stdout
 
 
 if __name__ == "__main__":
@@ -22,14 +22,17 @@ from whosspr.config import (
 class TestModelSize:
     """Tests for ModelSize enum."""
     
-    def test_has_expected_values(self):
+    @pytest.mark.parametrize("member, value", [
+        (ModelSize.TINY, "tiny"),
+        (ModelSize.BASE, "base"),
+        (ModelSize.SMALL, "small"),
+        (ModelSize.MEDIUM, "medium"),
+        (ModelSize.LARGE, "large"),
+        (ModelSize.TURBO, "turbo"),
+    ])
+    def test_has_expected_values(self, member, value):
         """Test enum has all expected model sizes."""
-        assert ModelSize.TINY.value == "tiny"
-        assert ModelSize.BASE.value == "base"
-        assert ModelSize.SMALL.value == "small"
-        assert ModelSize.MEDIUM.value == "medium"
-        assert ModelSize.LARGE.value == "large"
-        assert ModelSize.TURBO.value == "turbo"
+        assert member.value == value
     
     def test_from_string(self):
         """Test creating from string."""
@@ -40,12 +43,15 @@ class TestModelSize:
 class TestDeviceType:
     """Tests for DeviceType enum."""
     
-    def test_has_expected_values(self):
+    @pytest.mark.parametrize("member, value", [
+        (DeviceType.AUTO, "auto"),
+        (DeviceType.CPU, "cpu"),
+        (DeviceType.MPS, "mps"),
+        (DeviceType.CUDA, "cuda"),
+    ])
+    def test_has_expected_values(self, member, value):
         """Test enum has all expected device types."""
-        assert DeviceType.AUTO.value == "auto"
-        assert DeviceType.CPU.value == "cpu"
-        assert DeviceType.MPS.value == "mps"
-        assert DeviceType.CUDA.value == "cuda"
+        assert member.value == value
 
 
 class TestWhisperConfig:
@@ -120,7 +126,13 @@ class TestAudioConfig:
         config = AudioConfig()
         assert config.sample_rate == 16000
         assert config.channels == 1
+        assert config.chunk_size == 256
         assert config.min_duration == 0.5
+    
+    def test_rejects_non_positive_chunk_size(self):
+        """Test chunk_size must be positive."""
+        with pytest.raises(ValueError):
+            AudioConfig(chunk_size=0)
 
 
 class TestConfig:
@@ -144,12 +156,10 @@ class TestConfig:
         )
         
         # Serialize
-        data = config.model_dump()
-        json_str = json.dumps(data)
+        json_str = config.model_dump_json()
         
         # Deserialize
-        loaded_data = json.loads(json_str)
-        loaded_config = Config.model_validate(loaded_data)
+        loaded_config = Config.model_validate_json(json_str)
         
         assert loaded_config.whisper.model_size == ModelSize.SMALL
         assert loaded_config.tmp_dir == "/tmp/test"
@@ -158,9 +168,9 @@ class TestConfig:
 class TestLoadConfig:
     """Tests for load_config function."""
     
-    def test_returns_defaults_when_no_file(self, tmp_path):
+    def test_returns_defaults_when_no_file(self, tmp_dir_module):
         """Test returns defaults when no config file exists."""
-        config = load_config(str(tmp_path / "nonexistent.json"))
+        config = load_config(str(tmp_dir_module / "nonexistent.json"))
         assert isinstance(config, Config)
         assert config.whisper.model_size == ModelSize.BASE
     
@@ -199,6 +209,22 @@ class TestSaveConfig:
             data = json.load(f)
         assert data["whisper"]["model_size"] == "turbo"
     
+    def test_compact_by_default(self, tmp_path):
+        """Test JSON is compact unless pretty output is requested."""
+        compact = save_config(Config(), str(tmp_path / "compact.json"))
+        pretty = save_config(Config(), str(tmp_path / "pretty.json"), pretty=True)
+        
+        assert "\n" not in compact.read_text()
+        assert '\n  "whisper": {' in pretty.read_text()
+        assert json.loads(compact.read_text()) == json.loads(pretty.read_text())
+    
+    def test_round_trips_non_ascii(self, tmp_path):
+        """Test non-ASCII values are written as UTF-8 regardless of locale."""
+        path = save_config(Config(whisper={"language": "français"}), str(tmp_path / "out.json"))
+        
+        assert "français" in path.read_text(encoding="utf-8")
+        assert load_config(str(path)).whisper.language == "français"
+    
     def test_creates_parent_directories(self, tmp_path):
         """Test creates parent directories."""
         path = tmp_path / "subdir" / "deep" / "config.json"
@@ -234,7 +260,7 @@ class TestFindConfigFile:
         result = find_config_file(str(config_file))
         assert result == config_file
     
-    def test_returns_none_for_nonexistent(self, tmp_path):
+    def test_returns_none_for_nonexistent(self, tmp_dir_module):
         """Test returns None for nonexistent explicit path."""
-        result = find_config_file(str(tmp_path / "nonexistent.json"))
+        result = find_config_file(str(tmp_dir_module / "nonexistent.json"))
         assert result is None
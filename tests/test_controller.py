@@ -1,31 +1,69 @@
 """Tests for whosspr.controller module."""
 
+from contextlib import ExitStack
+from types import SimpleNamespace
+
 import numpy as np
 import pytest
 from unittest.mock import patch, MagicMock
 
 from whosspr.controller import DictationController, DictationState
 from whosspr.config import Config
+from whosspr.keyboard import ShortcutMode
+
+
+def _boom(*args):
+    """Callback that always fails."""
+    raise RuntimeError("Callback error")
+
+
+@pytest.fixture
+def components():
+    """Patch the controller's components; yields the mocked instances."""
+    with ExitStack() as stack:
+        classes = {
+            name: stack.enter_context(patch(f"whosspr.controller.{cls}"))
+            for name, cls in (
+                ("recorder", "AudioRecorder"),
+                ("transcriber", "Transcriber"),
+                ("inserter", "TextInserter"),
+                ("shortcuts", "KeyboardShortcuts"),
+            )
+        }
+        yield SimpleNamespace(**{name: cls.return_value for name, cls in classes.items()})
+
+
+ONE_SECOND = np.zeros(16000, dtype=np.float32)
+ONE_SECOND.flags.writeable = False
+
+
+def record_one_second(components, text):
+    """Configure the mocks for a one-second recording transcribed to `text`."""
+    components.recorder.configure_mock(**{
+        "start.return_value": True,
+        "duration": 1.0,
+        "stop.return_value": ONE_SECOND,
+    })
+    components.transcriber.transcribe.return_value = text
 
 
 class TestDictationState:
     """Tests for DictationState enum."""
     
-    def test_states_exist(self):
-        """Test all states are defined."""
-        assert DictationState.IDLE
-        assert DictationState.RECORDING
-        assert DictationState.PROCESSING
+    @pytest.mark.parametrize("member, value", [
+        (DictationState.IDLE, "idle"),
+        (DictationState.RECORDING, "recording"),
+        (DictationState.PROCESSING, "processing"),
+    ])
+    def test_values(self, member, value):
+        """Test all states are defined with their string values."""
+        assert member.value == value
 
 
 class TestDictationController:
     """Tests for DictationController class."""
     
-    @patch("whosspr.controller.Transcriber")
-    @patch("whosspr.controller.AudioRecorder")
-    @patch("whosspr.controller.TextInserter")
-    @patch("whosspr.controller.KeyboardShortcuts")
-    def test_init(self, mock_ks, mock_ins, mock_rec, mock_trans):
+    def test_init(self, components):
         """Test initialization."""
         config = Config()
         ctrl = DictationController(config)
@@ -33,15 +71,9 @@ class TestDictationController:
         assert ctrl.state == DictationState.IDLE
         assert ctrl.config == config
     
-    @patch("whosspr.controller.Transcriber")
-    @patch("whosspr.controller.AudioRecorder")
-    @patch("whosspr.controller.TextInserter")
-    @patch("whosspr.controller.KeyboardShortcuts")
-    def test_start_recording(self, mock_ks, mock_ins, mock_rec_class, mock_trans):
+    def test_start_recording(self, components):
         """Test start recording."""
-        mock_rec = MagicMock()
-        mock_rec.start.return_value = True
-        mock_rec_class.return_value = mock_rec
+        components.recorder.start.return_value = True
         
         ctrl = DictationController(Config())
         result = ctrl.start_recording()
@@ -49,15 +81,9 @@ class TestDictationController:
         assert result is True
         assert ctrl.state == DictationState.RECORDING
     
-    @patch("whosspr.controller.Transcriber")
-    @patch("whosspr.controller.AudioRecorder")
-    @patch("whosspr.controller.TextInserter")
-    @patch("whosspr.controller.KeyboardShortcuts")
-    def test_start_recording_fails(self, mock_ks, mock_ins, mock_rec_class, mock_trans):
+    def test_start_recording_fails(self, components):
         """Test start recording failure."""
-        mock_rec = MagicMock()
-        mock_rec.start.return_value = False
-        mock_rec_class.return_value = mock_rec
+        components.recorder.start.return_value = False
         
         ctrl = DictationController(Config())
         result = ctrl.start_recording()
@@ -65,16 +91,11 @@ class TestDictationController:
         assert result is False
         assert ctrl.state == DictationState.IDLE
     
-    @patch("whosspr.controller.Transcriber")
-    @patch("whosspr.controller.AudioRecorder")
-    @patch("whosspr.controller.TextInserter")
-    @patch("whosspr.controller.KeyboardShortcuts")
-    def test_stop_recording_too_short(self, mock_ks, mock_ins, mock_rec_class, mock_trans):
+    def test_stop_recording_too_short(self, components):
         """Test stop with too short recording."""
-        mock_rec = MagicMock()
+        mock_rec = components.recorder
         mock_rec.start.return_value = True
-        mock_rec.stop.return_value = np.zeros(100)  # Too short
-        mock_rec_class.return_value = mock_rec
+        mock_rec.duration = 100 / 16000  # Too short
         
         config = Config()
         config.audio.min_duration = 0.5
@@ -86,122 +107,113 @@ class TestDictationController:
         
         assert result is False
         assert ctrl.state == DictationState.IDLE
+        mock_rec.cancel.assert_called_once()
+        mock_rec.stop.assert_not_called()
     
-    @patch("whosspr.controller.Transcriber")
-    @patch("whosspr.controller.AudioRecorder")
-    @patch("whosspr.controller.TextInserter")
-    @patch("whosspr.controller.KeyboardShortcuts")
-    def test_stop_recording_success(self, mock_ks, mock_ins_class, mock_rec_class, mock_trans_class):
-        """Test successful stop and processing."""
-        # Setup mocks
-        mock_rec = MagicMock()
-        mock_rec.start.return_value = True
-        mock_rec.stop.return_value = np.zeros(16000)  # 1 second
-        mock_rec_class.return_value = mock_rec
+    @pytest.mark.parametrize("enhanced, inserted", [
+        (None, "Hello world"),
+        ("enhanced text", "enhanced text"),
+    ], ids=["plain", "enhanced"])
+    def test_stop_recording_pipeline(self, components, enhanced, inserted):
+        """Test stop runs transcribe → enhance → insert and ends IDLE."""
+        record_one_second(components, "Hello world")
+        enhancer = MagicMock(return_value=enhanced) if enhanced else None
         
-        mock_trans = MagicMock()
-        mock_trans.transcribe.return_value = "Hello world"
-        mock_trans_class.return_value = mock_trans
+        ctrl = DictationController(Config(), enhancer=enhancer)
+        ctrl.start_recording()
+        result = ctrl.stop_recording()
         
-        mock_ins = MagicMock()
-        mock_ins.insert.return_value = True
-        mock_ins_class.return_value = mock_ins
+        assert result is True
+        assert ctrl.state == DictationState.IDLE
+        if enhancer:
+            enhancer.assert_called_once_with("Hello world")
+        components.inserter.insert.assert_called_once_with(inserted, prepend_space=True)
+    
+    def test_stop_recording_empty_transcription(self, components):
+        """Test an empty transcription inserts nothing."""
+        record_one_second(components, "")
         
-        config = Config()
-        ctrl = DictationController(config)
+        ctrl = DictationController(Config())
         ctrl.start_recording()
         result = ctrl.stop_recording()
         
-        assert result is True
+        assert result is False
         assert ctrl.state == DictationState.IDLE
-        mock_ins.insert.assert_called_with("Hello world", prepend_space=True)
+        components.inserter.insert.assert_not_called()
     
-    @patch("whosspr.controller.Transcriber")
-    @patch("whosspr.controller.AudioRecorder")
-    @patch("whosspr.controller.TextInserter")
-    @patch("whosspr.controller.KeyboardShortcuts")
-    def test_cancel_recording(self, mock_ks, mock_ins, mock_rec_class, mock_trans):
+    def test_stop_recording_transcribe_error(self, components):
+        """Test a transcription error is reported and returns to IDLE."""
+        record_one_second(components, "unused")
+        components.transcriber.transcribe.side_effect = RuntimeError("Model error")
+        errors = []
+        
+        ctrl = DictationController(Config(), on_error=errors.append)
+        ctrl.start_recording()
+        result = ctrl.stop_recording()
+        
+        assert result is False
+        assert ctrl.state == DictationState.IDLE
+        assert errors == ["Processing failed: Model error"]
+        components.inserter.insert.assert_not_called()
+    
+    def test_cancel_recording(self, components):
         """Test cancel recording."""
-        mock_rec = MagicMock()
-        mock_rec.start.return_value = True
-        mock_rec_class.return_value = mock_rec
+        components.recorder.start.return_value = True
         
         ctrl = DictationController(Config())
         ctrl.start_recording()
         ctrl.cancel_recording()
         
         assert ctrl.state == DictationState.IDLE
-        mock_rec.cancel.assert_called_once()
+        components.recorder.cancel.assert_called_once()
     
-    @patch("whosspr.controller.Transcriber")
-    @patch("whosspr.controller.AudioRecorder")
-    @patch("whosspr.controller.TextInserter")
-    @patch("whosspr.controller.KeyboardShortcuts")
-    def test_callbacks(self, mock_ks, mock_ins_class, mock_rec_class, mock_trans_class):
+    def test_callbacks(self, components):
         """Test callbacks are called."""
-        mock_rec = MagicMock()
-        mock_rec.start.return_value = True
-        mock_rec.stop.return_value = np.zeros(16000)
-        mock_rec_class.return_value = mock_rec
+        record_one_second(components, "Test")
         
-        mock_trans = MagicMock()
-        mock_trans.transcribe.return_value = "Test"
-        mock_trans_class.return_value = mock_trans
+        states, texts = [], []
         
-        mock_ins = MagicMock()
-        mock_ins_class.return_value = mock_ins
-        
-        on_state = MagicMock()
-        on_text = MagicMock()
-        
-        ctrl = DictationController(Config(), on_state=on_state, on_text=on_text)
+        ctrl = DictationController(Config(), on_state=states.append, on_text=texts.append)
         ctrl.start_recording()
         ctrl.stop_recording()
         
-        assert on_state.called
-        on_text.assert_called_with("Test")
+        assert states == [DictationState.RECORDING, DictationState.PROCESSING, DictationState.IDLE]
+        assert texts == ["Test"]
     
-    @patch("whosspr.controller.Transcriber")
-    @patch("whosspr.controller.AudioRecorder")
-    @patch("whosspr.controller.TextInserter")
-    @patch("whosspr.controller.KeyboardShortcuts")
-    def test_enhancer_called(self, mock_ks, mock_ins_class, mock_rec_class, mock_trans_class):
-        """Test enhancer is called when provided."""
-        mock_rec = MagicMock()
-        mock_rec.start.return_value = True
-        mock_rec.stop.return_value = np.zeros(16000)
-        mock_rec_class.return_value = mock_rec
+    def test_callback_errors_handled(self, components):
+        """Test failing state/text callbacks don't break the dictation flow."""
+        record_one_second(components, "Test")
         
-        mock_trans = MagicMock()
-        mock_trans.transcribe.return_value = "raw text"
-        mock_trans_class.return_value = mock_trans
+        ctrl = DictationController(Config(), on_state=_boom, on_text=_boom)
+        assert ctrl.start_recording() is True
+        assert ctrl.stop_recording() is True
         
-        mock_ins = MagicMock()
-        mock_ins_class.return_value = mock_ins
+        assert ctrl.state == DictationState.IDLE
+        components.inserter.insert.assert_called_once()
+    
+    def test_shortcuts_registered_in_one_batch(self, components):
+        """Test both configured shortcuts are registered with a single call."""
+        ctrl = DictationController(Config())
+        ctrl._setup_shortcuts()
         
-        enhancer = MagicMock(return_value="enhanced text")
+        components.shortcuts.register_many.assert_called_once()
+        (shortcuts,), _ = components.shortcuts.register_many.call_args
+        assert [s.mode for s in shortcuts] == [ShortcutMode.HOLD, ShortcutMode.TOGGLE]
+    
+    def test_start_preloads_model_and_audio(self, components):
+        """Test start() loads the model and audio backend before listening."""
+        components.shortcuts.start.return_value = True
         
-        ctrl = DictationController(Config(), enhancer=enhancer)
-        ctrl.start_recording()
-        ctrl.stop_recording()
+        assert DictationController(Config()).start() is True
         
-        enhancer.assert_called_with("raw text")
-        mock_ins.insert.assert_called_with("enhanced text", prepend_space=True)
+        components.recorder.preload.assert_called_once()
+        components.shortcuts.start.assert_called_once()
     
-    @patch("whosspr.controller.Transcriber")
-    @patch("whosspr.controller.AudioRecorder")
-    @patch("whosspr.controller.TextInserter")
-    @patch("whosspr.controller.KeyboardShortcuts")
-    def test_context_manager(self, mock_ks_class, mock_ins, mock_rec, mock_trans_class):
+    def test_context_manager(self, components):
         """Test context manager interface."""
-        mock_ks = MagicMock()
-        mock_ks.start.return_value = True
-        mock_ks_class.return_value = mock_ks
-        
-        mock_trans = MagicMock()
-        mock_trans_class.return_value = mock_trans
+        components.shortcuts.start.return_value = True
         
         with DictationController(Config()) as ctrl:
             assert ctrl is not None
         
-        mock_ks.stop.assert_called()
+        components.shortcuts.stop.assert_called()
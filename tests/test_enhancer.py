@@ -1,8 +1,12 @@
 """Tests for whosspr.enhancer module."""
 
 import os
+import subprocess
+from pathlib import Path
+from types import SimpleNamespace
+
 import pytest
-from unittest.mock import MagicMock, patch
+from unittest.mock import Mock, patch
 
 from whosspr.enhancer import (
     TextEnhancer,
@@ -12,6 +16,56 @@ from whosspr.enhancer import (
 )
 
 
+@pytest.fixture(scope="module", autouse=True)
+def _patched_openai():
+    """Patch the OpenAI client class once for the whole module."""
+    with patch("openai.OpenAI") as mock_openai_class:
+        yield mock_openai_class
+
+
+@pytest.fixture
+def mock_openai_class(_patched_openai):
+    """Return the shared OpenAI mock, reset for the current test."""
+    _patched_openai.reset_mock(return_value=True, side_effect=True)
+    return _patched_openai
+
+
+@pytest.fixture(scope="module")
+def _shared_enhancer(_patched_openai):
+    """Build one TextEnhancer for the whole module around a minimal client."""
+    with patch.object(_patched_openai, "return_value", fake_client()):
+        return TextEnhancer(api_key="test-key")
+
+
+@pytest.fixture
+def enhancer(_shared_enhancer):
+    """Return the shared TextEnhancer with its create() mock reset."""
+    _shared_enhancer.client.chat.completions.create.reset_mock(return_value=True, side_effect=True)
+    return _shared_enhancer
+
+
+@pytest.fixture
+def mock_helper_run():
+    """Patch the api_key_helper subprocess call so no shell is forked."""
+    with patch("whosspr.enhancer.subprocess.run") as mock_run:
+        yield mock_run
+
+
+def fake_client():
+    """Build an OpenAI client exposing only chat.completions.create()."""
+    return SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=Mock())))
+
+
+def chat_response(content):
+    """Build a chat completion response carrying a single message."""
+    return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+
+def completed(returncode=0, stdout=""):
+    """Build the result of a finished helper command."""
+    return subprocess.CompletedProcess(args="", returncode=returncode, stdout=stdout)
+
+
 # =============================================================================
 # TextEnhancer Tests
 # =============================================================================
@@ -27,7 +81,6 @@ class TestTextEnhancer:
         with pytest.raises(ValueError, match="API key is required"):
             TextEnhancer(api_key=None)
     
-    @patch("whosspr.enhancer.OpenAI")
     def test_init_success(self, mock_openai_class):
         """Test successful initialization."""
         enhancer = TextEnhancer(api_key="test-key", model="gpt-4")
@@ -35,23 +88,18 @@ class TestTextEnhancer:
         assert enhancer.model == "gpt-4"
         mock_openai_class.assert_called_once()
     
-    @patch("whosspr.enhancer.OpenAI")
-    def test_default_prompt(self, mock_openai_class):
+    def test_default_prompt(self, enhancer):
         """Test default system prompt is used."""
-        enhancer = TextEnhancer(api_key="test-key")
-        
         assert enhancer.system_prompt == DEFAULT_SYSTEM_PROMPT
     
-    @patch("whosspr.enhancer.OpenAI")
-    def test_custom_prompt(self, mock_openai_class):
+    def test_custom_prompt(self):
         """Test custom system prompt."""
         custom = "You are a test prompt."
         enhancer = TextEnhancer(api_key="test-key", system_prompt=custom)
         
         assert enhancer.system_prompt == custom
     
-    @patch("whosspr.enhancer.OpenAI")
-    def test_prompt_from_file(self, mock_openai_class, tmp_path):
+    def test_prompt_from_file(self, tmp_path):
         """Test loading prompt from file."""
         prompt_file = tmp_path / "prompt.txt"
         prompt_file.write_text("Custom file prompt.")
@@ -63,22 +111,20 @@ class TestTextEnhancer:
         
         assert enhancer.system_prompt == "Custom file prompt."
     
-    @patch("whosspr.enhancer.OpenAI")
-    def test_prompt_priority(self, mock_openai_class, tmp_path):
+    @patch.object(Path, "read_text", return_value="File prompt.")
+    def test_prompt_priority(self, mock_read):
         """Test custom prompt takes priority over file."""
-        prompt_file = tmp_path / "prompt.txt"
-        prompt_file.write_text("File prompt.")
-        
         enhancer = TextEnhancer(
             api_key="test-key",
             system_prompt="Custom takes priority",
-            prompt_file=str(prompt_file),
+            prompt_file="prompt.txt",
         )
         
         assert enhancer.system_prompt == "Custom takes priority"
+        mock_read.assert_not_called()
     
-    @patch("whosspr.enhancer.OpenAI")
-    def test_missing_prompt_file(self, mock_openai_class):
+    @patch.object(Path, "read_text", side_effect=FileNotFoundError)
+    def test_missing_prompt_file(self, mock_read):
         """Test fallback when prompt file doesn't exist."""
         enhancer = TextEnhancer(
             api_key="test-key",
@@ -87,66 +133,51 @@ class TestTextEnhancer:
         
         assert enhancer.system_prompt == DEFAULT_SYSTEM_PROMPT
     
-    @patch("whosspr.enhancer.OpenAI")
-    def test_enhance_empty_text(self, mock_openai_class):
-        """Test enhance rejects empty text."""
-        enhancer = TextEnhancer(api_key="test-key")
-        
+    @pytest.mark.parametrize("text", ["", "   "])
+    def test_enhance_empty_text(self, enhancer, text):
+        """Test enhance rejects empty or whitespace-only text."""
         with pytest.raises(ValueError, match="cannot be empty"):
-            enhancer.enhance("")
-        
-        with pytest.raises(ValueError, match="cannot be empty"):
-            enhancer.enhance("   ")
+            enhancer.enhance(text)
+        enhancer.client.chat.completions.create.assert_not_called()
     
-    @patch("whosspr.enhancer.OpenAI")
-    def test_enhance_success(self, mock_openai_class):
+    def test_enhance_success(self, enhancer):
         """Test successful text enhancement."""
-        mock_client = MagicMock()
-        mock_openai_class.return_value = mock_client
+        create = enhancer.client.chat.completions.create
+        create.return_value = chat_response("Enhanced text here")
         
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock()]
-        mock_response.choices[0].message.content = "Enhanced text here"
-        mock_client.chat.completions.create.return_value = mock_response
-        
-        enhancer = TextEnhancer(api_key="test-key")
         result = enhancer.enhance("Some raw text")
         
         assert result == "Enhanced text here"
-        mock_client.chat.completions.create.assert_called_once()
+        create.assert_called_once()
     
-    @patch("whosspr.enhancer.OpenAI")
-    def test_enhance_api_error(self, mock_openai_class):
+    def test_enhance_api_error(self, enhancer):
         """Test enhance handles API errors."""
-        mock_client = MagicMock()
-        mock_openai_class.return_value = mock_client
-        mock_client.chat.completions.create.side_effect = Exception("API Error")
-        
-        enhancer = TextEnhancer(api_key="test-key")
+        enhancer.client.chat.completions.create.side_effect = Exception("API Error")
         
         with pytest.raises(Exception, match="API Error"):
             enhancer.enhance("Some text")
     
-    @patch("whosspr.enhancer.OpenAI")
-    def test_callable_interface(self, mock_openai_class):
-        """Test enhancer can be called directly."""
-        mock_client = MagicMock()
-        mock_openai_class.return_value = mock_client
+    def test_enhance_recovers_after_api_error(self, enhancer):
+        """Test a failed call doesn't affect later calls on the same client."""
+        ok = chat_response("Enhanced")
+        enhancer.client.chat.completions.create.side_effect = [ok, RuntimeError("API Error"), ok]
         
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock()]
-        mock_response.choices[0].message.content = "Result"
-        mock_client.chat.completions.create.return_value = mock_response
+        assert enhancer.enhance("text1") == "Enhanced"
+        with pytest.raises(RuntimeError, match="API Error"):
+            enhancer.enhance("text2")
+        assert enhancer.enhance("text3") == "Enhanced"
+    
+    def test_callable_interface(self, enhancer):
+        """Test enhancer can be called directly."""
+        enhancer.client.chat.completions.create.return_value = chat_response("Result")
         
-        enhancer = TextEnhancer(api_key="test-key")
         result = enhancer("Some text")  # Call directly
         
         assert result == "Result"
     
-    @patch("whosspr.enhancer.OpenAI")
     def test_client_property(self, mock_openai_class):
         """Test client property returns OpenAI client."""
-        mock_client = MagicMock()
+        mock_client = fake_client()
         mock_openai_class.return_value = mock_client
         
         enhancer = TextEnhancer(api_key="test-key")
@@ -161,61 +192,44 @@ class TestTextEnhancer:
 class TestResolveApiKey:
     """Tests for resolve_api_key function."""
     
-    def test_direct_key(self):
-        """Test direct API key takes priority."""
-        result = resolve_api_key(api_key="direct-key")
-        assert result == "direct-key"
-    
-    def test_direct_key_strips_whitespace(self):
-        """Test whitespace is stripped."""
-        result = resolve_api_key(api_key="  key-with-spaces  ")
-        assert result == "key-with-spaces"
-    
-    def test_empty_direct_key(self):
-        """Test empty direct key is skipped."""
-        result = resolve_api_key(api_key="", api_key_env_var="TEST_VAR")
-        assert result is None
+    @pytest.mark.parametrize("kwargs, env, expected", [
+        pytest.param(dict(api_key="direct-key"), {}, "direct-key", id="direct"),
+        pytest.param(dict(api_key="  key-with-spaces  "), {}, "key-with-spaces", id="direct-stripped"),
+        pytest.param(dict(api_key="", api_key_env_var="TEST_VAR"), {}, None, id="empty-direct"),
+        pytest.param(dict(api_key_env_var="MY_API_KEY"), {"MY_API_KEY": "env-key"}, "env-key", id="env"),
+        pytest.param(dict(api_key_env_var="NONEXISTENT_VAR_XYZ"), {}, None, id="env-not-set"),
+        pytest.param(dict(api_key_env_var="EMPTY_KEY"), {"EMPTY_KEY": "  "}, None, id="env-blank"),
+        pytest.param({}, {}, None, id="all-none"),
+    ])
+    def test_resolve(self, monkeypatch, kwargs, env, expected):
+        """Test key resolution from direct values and environment variables."""
+        for name, value in env.items():
+            monkeypatch.setenv(name, value)
+        
+        assert resolve_api_key(**kwargs) == expected
     
-    @patch("subprocess.run")
-    def test_helper_command(self, mock_run):
+    def test_helper_command(self, mock_helper_run):
         """Test API key from helper command."""
-        mock_run.return_value = MagicMock(
-            returncode=0,
-            stdout="helper-key\n",
-        )
+        mock_helper_run.return_value = completed(stdout="helper-key\n")
         
         result = resolve_api_key(api_key_helper="echo helper-key")
         assert result == "helper-key"
     
-    @patch("subprocess.run")
-    def test_helper_command_failure(self, mock_run):
+    def test_helper_command_failure(self, mock_helper_run):
         """Test helper command failure falls through."""
-        mock_run.return_value = MagicMock(returncode=1, stdout="")
+        mock_helper_run.return_value = completed(returncode=1)
         
         result = resolve_api_key(api_key_helper="failing-command")
         assert result is None
     
-    @patch("subprocess.run")
-    def test_helper_command_timeout(self, mock_run):
+    def test_helper_command_timeout(self, mock_helper_run):
         """Test helper command timeout."""
-        import subprocess
-        mock_run.side_effect = subprocess.TimeoutExpired("cmd", 30)
+        mock_helper_run.side_effect = subprocess.TimeoutExpired("cmd", 30)
         
         result = resolve_api_key(api_key_helper="slow-command")
         assert result is None
     
-    def test_env_var(self):
-        """Test API key from environment variable."""
-        with patch.dict(os.environ, {"MY_API_KEY": "env-key"}):
-            result = resolve_api_key(api_key_env_var="MY_API_KEY")
-            assert result == "env-key"
-    
-    def test_env_var_not_set(self):
-        """Test missing environment variable."""
-        result = resolve_api_key(api_key_env_var="NONEXISTENT_VAR_XYZ")
-        assert result is None
-    
-    def test_priority_order(self):
+    def test_priority_order(self, mock_helper_run):
         """Test priority: direct > helper > env."""
         with patch.dict(os.environ, {"ENV_KEY": "env-value"}):
             # Direct wins
@@ -225,11 +239,11 @@ class TestResolveApiKey:
                 api_key_env_var="ENV_KEY",
             )
             assert result == "direct"
+        mock_helper_run.assert_not_called()
     
-    @patch("subprocess.run")
-    def test_helper_priority_over_env(self, mock_run):
+    def test_helper_priority_over_env(self, mock_helper_run):
         """Test helper takes priority over env."""
-        mock_run.return_value = MagicMock(returncode=0, stdout="helper-key")
+        mock_helper_run.return_value = completed(stdout="helper-key")
         
         with patch.dict(os.environ, {"ENV_KEY": "env-value"}):
             result = resolve_api_key(
@@ -237,11 +251,6 @@ class TestResolveApiKey:
                 api_key_env_var="ENV_KEY",
             )
             assert result == "helper-key"
-    
-    def test_all_none(self):
-        """Test returns None when nothing provided."""
-        result = resolve_api_key()
-        assert result is None
 
 
 # =============================================================================
@@ -251,8 +260,7 @@ class TestResolveApiKey:
 class TestCreateEnhancer:
     """Tests for create_enhancer function."""
     
-    @patch("whosspr.enhancer.OpenAI")
-    def test_create_with_direct_key(self, mock_openai_class):
+    def test_create_with_direct_key(self):
         """Test creating enhancer with direct key."""
         enhancer = create_enhancer(api_key="test-key")
         
@@ -264,8 +272,7 @@ class TestCreateEnhancer:
         enhancer = create_enhancer()
         assert enhancer is None
     
-    @patch("whosspr.enhancer.OpenAI")
-    def test_create_with_all_options(self, mock_openai_class):
+    def test_create_with_all_options(self):
         """Test creating enhancer with all options."""
         enhancer = create_enhancer(
             api_key="key",
@@ -278,11 +285,9 @@ class TestCreateEnhancer:
         assert enhancer.model == "gpt-4"
         assert enhancer.system_prompt == "Custom prompt"
     
-    @patch("subprocess.run")
-    @patch("whosspr.enhancer.OpenAI")
-    def test_create_with_helper(self, mock_openai_class, mock_run):
+    def test_create_with_helper(self, mock_helper_run):
         """Test creating enhancer with helper command."""
-        mock_run.return_value = MagicMock(returncode=0, stdout="helper-key")
+        mock_helper_run.return_value = completed(stdout="helper-key")
         
         enhancer = create_enhancer(api_key_helper="get-key")
         
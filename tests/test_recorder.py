@@ -1,12 +1,49 @@
 """Tests for whosspr.recorder module."""
 
+import sys
+from types import SimpleNamespace
+
 import numpy as np
 import pytest
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch
 
 from whosspr.recorder import AudioRecorder
 
 
+class FakeInputStream:
+    """Minimal stand-in for sounddevice.InputStream."""
+    
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
+        self.started = False
+        self.stopped = False
+        self.closed = False
+    
+    def start(self):
+        self.started = True
+    
+    def stop(self):
+        self.stopped = True
+    
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture(scope="module", autouse=True)
+def fake_sd():
+    """Swap in a fake sounddevice module once for the whole module."""
+    with patch.dict(sys.modules, {"sounddevice": SimpleNamespace(InputStream=FakeInputStream)}):
+        yield
+
+
+@pytest.fixture(scope="module")
+def silence():
+    """One second of read-only mono silence; tests feed slices of it."""
+    block = np.zeros((16000, 1), dtype=np.float32)
+    block.setflags(write=False)
+    return block
+
+
 class TestAudioRecorder:
     """Tests for AudioRecorder class."""
     
@@ -15,6 +52,7 @@ class TestAudioRecorder:
         rec = AudioRecorder()
         assert rec.sample_rate == 16000
         assert rec.channels == 1
+        assert rec.chunk_size == 256
         assert not rec.is_recording
         assert rec.duration == 0.0
     
@@ -24,79 +62,124 @@ class TestAudioRecorder:
         assert rec.sample_rate == 44100
         assert rec.channels == 2
     
-    @patch("whosspr.recorder.sd.InputStream")
-    def test_start_success(self, mock_stream_class):
+    def test_start_success(self):
         """Test successful recording start."""
-        mock_stream = MagicMock()
-        mock_stream_class.return_value = mock_stream
-        
         rec = AudioRecorder()
         result = rec.start()
         
         assert result is True
         assert rec.is_recording is True
-        mock_stream.start.assert_called_once()
+        assert rec._stream.started
+        assert rec._stream.kwargs["blocksize"] == rec.chunk_size
     
-    @patch("whosspr.recorder.sd.InputStream")
-    def test_start_already_recording(self, mock_stream_class):
+    def test_preload_tolerates_missing_backend(self):
+        """Test preload() leaves a missing sounddevice for start() to report."""
+        rec = AudioRecorder()
+        with patch.dict(sys.modules, {"sounddevice": None}):
+            rec.preload()
+            assert rec.start() is False
+    
+    def test_start_already_recording(self):
         """Test start when already recording."""
-        mock_stream = MagicMock()
-        mock_stream_class.return_value = mock_stream
-        
         rec = AudioRecorder()
         rec.start()
         result = rec.start()  # Second call
         
         assert result is False
     
-    @patch("whosspr.recorder.sd.InputStream")
-    def test_stop_returns_audio(self, mock_stream_class):
+    def test_stop_returns_audio(self, silence):
         """Test stop returns recorded audio."""
-        mock_stream = MagicMock()
-        mock_stream_class.return_value = mock_stream
-        
         rec = AudioRecorder()
         rec.start()
+        stream = rec._stream
         
         # Simulate callback adding frames
-        rec._frames = [np.zeros(1000, dtype=np.float32)]
+        rec._callback(silence[:1000], 1000, None, None)
         
         audio = rec.stop()
         
         assert audio is not None
         assert len(audio) == 1000
         assert not rec.is_recording
+        assert stream.stopped and stream.closed
+    
+    def test_stop_failure_resets_state(self):
+        """Test a stream that fails to stop still leaves the recorder reusable."""
+        class BrokenStream(FakeInputStream):
+            def stop(self):
+                raise RuntimeError("device unplugged")
+        
+        rec = AudioRecorder()
+        rec.start()
+        rec._stream = BrokenStream()
+        
+        with pytest.raises(RuntimeError):
+            rec.stop()
+        
+        assert not rec.is_recording
+        assert rec._stream is None
+        assert rec.start() is True
     
-    @patch("whosspr.recorder.sd.InputStream")
-    def test_stop_when_not_recording(self, mock_stream_class):
+    def test_stop_when_not_recording(self):
         """Test stop when not recording."""
         rec = AudioRecorder()
         audio = rec.stop()
         assert audio is None
     
-    @patch("whosspr.recorder.sd.InputStream")
-    def test_cancel_discards_data(self, mock_stream_class):
+    def test_cancel_discards_data(self, silence):
         """Test cancel discards recorded data."""
-        mock_stream = MagicMock()
-        mock_stream_class.return_value = mock_stream
-        
         rec = AudioRecorder()
         rec.start()
-        rec._frames = [np.zeros(1000, dtype=np.float32)]
+        stream = rec._stream
+        rec._callback(silence[:1000], 1000, None, None)
         
         rec.cancel()
         
         assert not rec.is_recording
-        assert rec._frames == []
+        assert rec.duration == 0.0
+        assert stream.closed and not stream.stopped
     
-    @patch("whosspr.recorder.sd.InputStream")
-    def test_duration_during_recording(self, mock_stream_class):
+    def test_duration_during_recording(self, silence):
         """Test duration calculation during recording."""
-        mock_stream = MagicMock()
-        mock_stream_class.return_value = mock_stream
-        
         rec = AudioRecorder(sample_rate=16000)
         rec.start()
-        rec._frames = [np.zeros(16000, dtype=np.float32)]  # 1 second
+        rec._callback(silence, 16000, None, None)  # 1 second
         
         assert rec.duration == pytest.approx(1.0)
+    
+    def test_callback_stores_block(self):
+        """Test callback copies the block into the buffer prefix."""
+        rec = AudioRecorder()
+        rec.start()
+        block = np.arange(10, dtype=np.float32).reshape(-1, 1)
+        
+        rec._callback(block, 10, None, None)
+        
+        assert np.array_equal(rec._buffer[:len(block)], block)
+    
+    def test_recording_spans_multiple_slabs(self):
+        """Test recording longer than one slab keeps all audio."""
+        rec = AudioRecorder(sample_rate=16000, slab_seconds=0.1)
+        rec.start()
+        for i in range(3):
+            rec._callback(np.full((1000, 1), i, dtype=np.float32), 1000, None, None)
+        assert rec.duration == pytest.approx(3000 / 16000)
+        
+        audio = rec.stop()
+        
+        assert len(audio) == 3000
+        assert audio[0] == 0 and audio[1000] == 1 and audio[2999] == 2
+        # Extra slabs are released once the long recording has been handed off
+        assert len(rec._buffer) == 1600
+        assert not rec._slabs
+    
+    def test_callback_status_logged_on_stop(self, caplog, silence):
+        """Test stream status is logged from stop(), not the audio thread."""
+        rec = AudioRecorder()
+        rec.start()
+        with caplog.at_level("WARNING", logger="whosspr.recorder"):
+            rec._callback(silence[:10], 10, None, "input overflow")
+            assert not caplog.records
+            rec.stop()
+        
+        assert "input overflow" in caplog.text
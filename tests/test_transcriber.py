@@ -2,31 +2,34 @@
 
 import numpy as np
 import pytest
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch
 
 from whosspr.transcriber import Transcriber, get_device, MODEL_NAMES
 from whosspr.config import ModelSize, DeviceType
 
 
+@pytest.fixture
+def mock_load():
+    """Patch whisper.load_model on a CPU-only torch; yields the load mock."""
+    with patch("torch.cuda.is_available", return_value=False), \
+         patch("torch.backends.mps.is_available", return_value=False), \
+         patch("whisper.load_model") as mock_load:
+        yield mock_load
+
+
 class TestGetDevice:
     """Tests for get_device function."""
     
-    @patch("whosspr.transcriber.torch.cuda.is_available", return_value=False)
-    @patch("whosspr.transcriber.torch.backends.mps.is_available", return_value=False)
-    def test_auto_cpu(self, mock_mps, mock_cuda):
-        """Test AUTO falls back to CPU."""
-        assert get_device(DeviceType.AUTO) == "cpu"
-    
-    @patch("whosspr.transcriber.torch.cuda.is_available", return_value=True)
-    def test_auto_cuda(self, mock_cuda):
-        """Test AUTO uses CUDA when available."""
-        assert get_device(DeviceType.AUTO) == "cuda"
-    
-    @patch("whosspr.transcriber.torch.cuda.is_available", return_value=False)
-    @patch("whosspr.transcriber.torch.backends.mps.is_available", return_value=True)
-    def test_auto_mps(self, mock_mps, mock_cuda):
-        """Test AUTO uses MPS when available."""
-        assert get_device(DeviceType.AUTO) == "mps"
+    @pytest.mark.parametrize("cuda, mps, expected", [
+        (False, False, "cpu"),
+        (True, False, "cuda"),
+        (False, True, "mps"),
+    ])
+    def test_auto(self, cuda, mps, expected):
+        """Test AUTO prefers CUDA, then MPS, then falls back to CPU."""
+        with patch("torch.cuda.is_available", return_value=cuda), \
+             patch("torch.backends.mps.is_available", return_value=mps):
+            assert get_device(DeviceType.AUTO) == expected
     
     def test_explicit_cpu(self):
         """Test explicit CPU device."""
@@ -42,14 +45,20 @@ class TestTranscriber:
         assert t.model_size == ModelSize.BASE
         assert t.language == "en"
     
-    @patch("whosspr.transcriber.whisper.load_model")
-    @patch("whosspr.transcriber.torch.cuda.is_available", return_value=False)
-    @patch("whosspr.transcriber.torch.backends.mps.is_available", return_value=False)
-    def test_transcribe(self, mock_mps, mock_cuda, mock_load):
+    @patch("whosspr.transcriber.get_device", return_value="cpu")
+    def test_device_resolved_lazily(self, mock_get_device):
+        """Test device detection is deferred until first use."""
+        t = Transcriber()
+        mock_get_device.assert_not_called()
+        
+        assert t.device == "cpu"
+        assert t.device == "cpu"
+        mock_get_device.assert_called_once()
+    
+    def test_transcribe(self, mock_load):
         """Test transcription."""
-        mock_model = MagicMock()
+        mock_model = mock_load.return_value
         mock_model.transcribe.return_value = {"text": " Hello world "}
-        mock_load.return_value = mock_model
         
         t = Transcriber()
         audio = np.random.rand(16000).astype(np.float32)
@@ -58,29 +67,16 @@ class TestTranscriber:
         assert result == "Hello world"
         mock_model.transcribe.assert_called_once()
     
-    @patch("whosspr.transcriber.whisper.load_model")
-    @patch("whosspr.transcriber.torch.cuda.is_available", return_value=False)
-    @patch("whosspr.transcriber.torch.backends.mps.is_available", return_value=False)
-    def test_model_loads_once(self, mock_mps, mock_cuda, mock_load):
+    def test_model_loads_once(self, mock_load):
         """Test model is loaded only once."""
-        mock_model = MagicMock()
-        mock_model.transcribe.return_value = {"text": "test"}
-        mock_load.return_value = mock_model
-        
         t = Transcriber()
         _ = t.model
         _ = t.model
         
         mock_load.assert_called_once()
     
-    @patch("whosspr.transcriber.whisper.load_model")
-    @patch("whosspr.transcriber.torch.cuda.is_available", return_value=False)
-    @patch("whosspr.transcriber.torch.backends.mps.is_available", return_value=False)
-    def test_unload(self, mock_mps, mock_cuda, mock_load):
+    def test_unload(self, mock_load):
         """Test model unloading."""
-        mock_model = MagicMock()
-        mock_load.return_value = mock_model
-        
         t = Transcriber()
         _ = t.model
         t.unload()
@@ -8,7 +8,7 @@ import signal
 import sys
 import time
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 import typer
 from rich.console import Console
@@ -20,9 +20,9 @@ from whosspr.config import (
     Config, ModelSize, DeviceType,
     load_config, save_config, create_default_config,
 )
-from whosspr.controller import DictationController, DictationState
-from whosspr.permissions import check_all, PermissionStatus
-from whosspr.enhancer import create_enhancer
+
+if TYPE_CHECKING:
+    from whosspr.controller import DictationController
 
 
 def setup_logging(debug: bool = False) -> None:
@@ -44,8 +44,18 @@ app = typer.Typer(
 )
 console = Console()
 
+# (name, parameters, approximate VRAM) shown by `whosspr models`
+MODEL_INFO = (
+    ("tiny", "39M", "~1 GB"),
+    ("base", "74M", "~1 GB"),
+    ("small", "244M", "~2 GB"),
+    ("medium", "769M", "~5 GB"),
+    ("large", "1.5B", "~10 GB"),
+    ("turbo", "809M", "~6 GB"),
+)
+
 # Global for signal handling
-_controller: Optional[DictationController] = None
+_controller: Optional["DictationController"] = None
 
 
 def version_callback(value: bool) -> None:
@@ -77,12 +87,17 @@ def start(
     api_key: Optional[str] = typer.Option(None, "--api-key", envvar="OPENAI_API_KEY"),
     hold_shortcut: Optional[str] = typer.Option(None, "--hold-shortcut"),
     toggle_shortcut: Optional[str] = typer.Option(None, "--toggle-shortcut"),
+    chunk_size: Optional[int] = typer.Option(None, "--chunk-size", min=1, help="Audio frames per callback."),
     skip_permission_check: bool = typer.Option(False, "--skip-permission-check"),
     debug: bool = typer.Option(False, "--debug"),
 ) -> None:
     """Start the WhOSSpr dictation service."""
     global _controller
     
+    from whosspr.controller import DictationController, DictationState
+    from whosspr.enhancer import create_enhancer
+    from whosspr.permissions import PermissionStatus, check_all
+    
     setup_logging(debug)
     logger.info(f"WhOSSpr Flow v{__version__} starting...")
     
@@ -113,6 +128,8 @@ def start(
         config.shortcuts.hold_to_dictate = hold_shortcut
     if toggle_shortcut:
         config.shortcuts.toggle_dictation = toggle_shortcut
+    if chunk_size is not None:
+        config.audio.chunk_size = chunk_size
     
     # Check permissions
     if not skip_permission_check:
@@ -203,6 +220,8 @@ def start(
 @app.command()
 def check() -> None:
     """Check required macOS permissions."""
+    from whosspr.permissions import PermissionStatus, check_all
+    
     console.print(Panel.fit("[bold]Permission Check[/bold]", title="WhOSSpr Flow"))
     
     perms = check_all()
@@ -237,7 +256,7 @@ def config(
     if init:
         out_path = path or Path("whosspr.json")
         cfg = create_default_config()
-        save_config(cfg, str(out_path))
+        save_config(cfg, str(out_path), pretty=True)
         console.print(f"[green]Created:[/green] {out_path}")
         return
     
@@ -265,16 +284,7 @@ def models() -> None:
     table.add_column("Size")
     table.add_column("~VRAM")
     
-    info = [
-        ("tiny", "39M", "~1 GB"),
-        ("base", "74M", "~1 GB"),
-        ("small", "244M", "~2 GB"),
-        ("medium", "769M", "~5 GB"),
-        ("large", "1.5B", "~10 GB"),
-        ("turbo", "809M", "~6 GB"),
-    ]
-    
-    for name, size, vram in info:
+    for name, size, vram in MODEL_INFO:
         table.add_row(name, size, vram)
     
     console.print(table)
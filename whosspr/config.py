@@ -1,6 +1,5 @@
 """WhOSSpr Configuration - Schema and management in one module."""
 
-import json
 import logging
 import os
 from enum import Enum
@@ -75,6 +74,7 @@ class AudioConfig(BaseModel):
     """Audio recording settings."""
     sample_rate: int = Field(default=16000)
     channels: int = Field(default=1)
+    chunk_size: int = Field(default=256, gt=0, description="Frames per audio callback (256 = 16ms at 16kHz)")
     min_duration: float = Field(default=0.5)
     prepend_space: bool = Field(default=True, description="Add leading space before inserted text")
 
@@ -132,10 +132,8 @@ def load_config(path: Optional[str] = None) -> Config:
     if config_file:
         logger.info(f"Loading config from {config_file}")
         try:
-            with open(config_file, "r") as f:
-                data = json.load(f)
-            return Config.model_validate(data)
-        except (json.JSONDecodeError, ValueError) as e:
+            return Config.model_validate_json(config_file.read_bytes())
+        except ValueError as e:
             logger.warning(f"Failed to load config: {e}, using defaults")
             return Config()
     else:
@@ -143,12 +141,13 @@ def load_config(path: Optional[str] = None) -> Config:
         return Config()
 
 
-def save_config(config: Config, path: str) -> Path:
+def save_config(config: Config, path: str, pretty: bool = False) -> Path:
     """Save configuration to file.
     
     Args:
         config: Configuration to save.
         path: Path to save to.
+        pretty: Indent the JSON for humans (compact by default).
         
     Returns:
         Path where config was saved.
@@ -156,8 +155,8 @@ def save_config(config: Config, path: str) -> Path:
     save_path = Path(path)
     save_path.parent.mkdir(parents=True, exist_ok=True)
     
-    with open(save_path, "w") as f:
-        json.dump(config.model_dump(), f, indent=2)
+    with open(save_path, "wb") as f:
+        f.write(config.model_dump_json(indent=2 if pretty else None).encode("utf-8"))
     
     logger.info(f"Saved config to {save_path}")
     return save_path
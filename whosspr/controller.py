@@ -15,7 +15,7 @@ from whosspr.config import Config
 from whosspr.recorder import AudioRecorder
 from whosspr.transcriber import Transcriber
 from whosspr.inserter import TextInserter
-from whosspr.keyboard import KeyboardShortcuts, ShortcutMode
+from whosspr.keyboard import KeyboardShortcuts, Shortcut, ShortcutMode
 
 
 logger = logging.getLogger(__name__)
@@ -71,6 +71,7 @@ class DictationController:
         self._recorder = AudioRecorder(
             sample_rate=config.audio.sample_rate,
             channels=config.audio.channels,
+            chunk_size=config.audio.chunk_size,
         )
         self._transcriber = Transcriber(
             model_size=config.whisper.model_size,
@@ -88,7 +89,7 @@ class DictationController:
     
     def _set_state(self, state: DictationState) -> None:
         """Update state and notify callback."""
-        if self._state != state:
+        if self._state is not state:
             self._state = state
             logger.debug(f"State: {state.value}")
             if self.on_state:
@@ -113,7 +114,7 @@ class DictationController:
         Returns:
             True if recording started.
         """
-        if self._state != DictationState.IDLE:
+        if self._state is not DictationState.IDLE:
             return False
         
         if self._recorder.start():
@@ -131,17 +132,22 @@ class DictationController:
         Returns:
             True if processing completed successfully.
         """
-        if self._state != DictationState.RECORDING:
+        if self._state is not DictationState.RECORDING:
             return False
         
-        audio = self._recorder.stop()
-        
-        # Check minimum duration
-        if audio is None or len(audio) / self.config.audio.sample_rate < self.config.audio.min_duration:
+        # Check minimum duration before materializing the audio
+        if self._recorder.duration < self.config.audio.min_duration:
+            self._recorder.cancel()
             logger.warning("Recording too short")
             self._set_state(DictationState.IDLE)
             return False
         
+        audio = self._recorder.stop()
+        if audio is None:
+            logger.warning("No audio recorded")
+            self._set_state(DictationState.IDLE)
+            return False
+        
         return self._process_audio(audio)
     
     def _process_audio(self, audio: np.ndarray) -> bool:
@@ -187,38 +193,42 @@ class DictationController:
     
     def cancel_recording(self) -> None:
         """Cancel current recording."""
-        if self._state == DictationState.RECORDING:
+        if self._state is DictationState.RECORDING:
             self._recorder.cancel()
             self._set_state(DictationState.IDLE)
     
     def _toggle_recording(self) -> None:
         """Toggle recording on/off (for toggle mode shortcuts)."""
-        if self._state == DictationState.IDLE:
+        if self._state is DictationState.IDLE:
             self.start_recording()
-        elif self._state == DictationState.RECORDING:
+        elif self._state is DictationState.RECORDING:
             self.stop_recording()
     
     def _setup_shortcuts(self) -> None:
         """Configure keyboard shortcuts from config."""
+        shortcuts = []
         if self.config.shortcuts.hold_to_dictate:
-            self._shortcuts.register(
-                self.config.shortcuts.hold_to_dictate,
+            shortcuts.append(Shortcut(
+                shortcut=self.config.shortcuts.hold_to_dictate,
                 on_activate=self.start_recording,
                 mode=ShortcutMode.HOLD,
                 on_deactivate=self.stop_recording,
-            )
+            ))
         
         if self.config.shortcuts.toggle_dictation:
-            self._shortcuts.register(
-                self.config.shortcuts.toggle_dictation,
+            shortcuts.append(Shortcut(
+                shortcut=self.config.shortcuts.toggle_dictation,
                 on_activate=self._toggle_recording,
                 mode=ShortcutMode.TOGGLE,
-            )
+            ))
+        
+        self._shortcuts.register_many(shortcuts)
     
     def start(self) -> bool:
         """Start the dictation service.
         
-        Pre-loads the Whisper model and starts listening for shortcuts.
+        Pre-loads the Whisper model and audio backend, then starts listening
+        for shortcuts.
         
         Returns:
             True if started successfully.
@@ -226,6 +236,7 @@ class DictationController:
         # Pre-load model
         logger.info("Loading Whisper model...")
         _ = self._transcriber.model
+        self._recorder.preload()
         
         # Setup shortcuts
         self._setup_shortcuts()
@@ -239,7 +250,7 @@ class DictationController:
     
     def stop(self) -> None:
         """Stop the dictation service."""
-        if self._state == DictationState.RECORDING:
+        if self._state is DictationState.RECORDING:
             self.cancel_recording()
         
         self._shortcuts.stop()
@@ -8,9 +8,10 @@ import logging
 import os
 import subprocess
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
-from openai import OpenAI
+if TYPE_CHECKING:
+    import openai
 
 
 logger = logging.getLogger(__name__)
@@ -51,6 +52,8 @@ class TextEnhancer:
         if not api_key:
             raise ValueError("API key is required for text enhancement")
         
+        from openai import OpenAI
+        
         self.model = model
         self.system_prompt = self._load_prompt(system_prompt, prompt_file)
         self._client = OpenAI(api_key=api_key, base_url=base_url)
@@ -67,11 +70,12 @@ class TextEnhancer:
             return custom
         
         if file_path:
-            path = Path(file_path)
-            if path.exists():
-                logger.debug(f"Loading prompt from {file_path}")
-                return path.read_text().strip()
-            logger.warning(f"Prompt file not found: {file_path}")
+            try:
+                prompt = Path(file_path).read_text().strip()
+                logger.debug(f"Loaded prompt from {file_path}")
+                return prompt
+            except FileNotFoundError:
+                logger.warning(f"Prompt file not found: {file_path}")
         
         return DEFAULT_SYSTEM_PROMPT
     
@@ -126,7 +130,7 @@ class TextEnhancer:
         return self.enhance(text)
     
     @property
-    def client(self) -> OpenAI:
+    def client(self) -> "openai.OpenAI":
         """Get the OpenAI client."""
         return self._client
 
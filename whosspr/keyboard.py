@@ -3,9 +3,10 @@
 Global keyboard shortcut detection using pynput.
 """
 
+import functools
 import logging
 from enum import Enum
-from typing import Callable, Optional, Set
+from typing import Callable, Iterable, NamedTuple, Optional, Set
 
 from pynput import keyboard
 from pynput.keyboard import Key, KeyCode
@@ -20,6 +21,14 @@ class ShortcutMode(str, Enum):
     TOGGLE = "toggle"  # Press to toggle on/off
 
 
+class Shortcut(NamedTuple):
+    """A shortcut to register, with the same fields as register()'s arguments."""
+    shortcut: str
+    on_activate: Callable[[], None]
+    mode: ShortcutMode = ShortcutMode.TOGGLE
+    on_deactivate: Optional[Callable[[], None]] = None
+
+
 # Map string names to pynput keys
 KEY_MAP = {
     "ctrl": Key.ctrl, "control": Key.ctrl,
@@ -36,8 +45,9 @@ KEY_MAP = {
 }
 
 
+@functools.lru_cache(maxsize=64)
 def parse_shortcut(shortcut: str) -> frozenset:
-    """Parse a shortcut string like 'ctrl+cmd+1' to a set of keys."""
+    """Parse a shortcut string like 'ctrl+cmd+1' to a set of keys (cached)."""
     keys = set()
     for part in shortcut.lower().replace(" ", "").split("+"):
         if part in KEY_MAP:
@@ -88,18 +98,33 @@ class KeyboardShortcuts:
             mode: HOLD or TOGGLE.
             on_deactivate: For HOLD mode, called when keys released.
         """
-        keys = parse_shortcut(shortcut)
-        if not keys:
-            logger.error(f"Invalid shortcut: {shortcut}")
-            return
+        self.register_many([Shortcut(shortcut, on_activate, mode, on_deactivate)])
+    
+    def register_many(self, shortcuts: Iterable[Shortcut]) -> None:
+        """Register several shortcuts at once.
+        
+        The new table is built aside and swapped in with one assignment, so a
+        running listener never sees it half-updated.
+        
+        Args:
+            shortcuts: Shortcuts to register.
+        """
+        table = dict(self._shortcuts)
+        for s in shortcuts:
+            keys = parse_shortcut(s.shortcut)
+            if not keys:
+                logger.error(f"Invalid shortcut: {s.shortcut}")
+                continue
+            
+            table[keys] = {
+                "on_activate": s.on_activate,
+                "on_deactivate": s.on_deactivate,
+                "mode": s.mode,
+                "active": False,
+            }
+            logger.info(f"Registered shortcut: {s.shortcut} ({s.mode.value})")
         
-        self._shortcuts[keys] = {
-            "on_activate": on_activate,
-            "on_deactivate": on_deactivate,
-            "mode": mode,
-            "active": False,
-        }
-        logger.info(f"Registered shortcut: {shortcut} ({mode.value})")
+        self._shortcuts = table
     
     def _on_press(self, key) -> None:
         """Handle key press."""
@@ -7,8 +7,6 @@ import subprocess
 import sys
 from enum import Enum
 
-import sounddevice as sd
-
 
 class PermissionStatus(str, Enum):
     """Permission status."""
@@ -23,6 +21,7 @@ def check_microphone() -> PermissionStatus:
         return PermissionStatus.GRANTED
     
     try:
+        import sounddevice as sd
         with sd.InputStream(channels=1, samplerate=16000):
             pass
         return PermissionStatus.GRANTED
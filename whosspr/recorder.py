@@ -4,10 +4,13 @@ Simple, focused module for capturing audio from the microphone.
 """
 
 import logging
-from typing import Optional
+from collections import deque
+from typing import TYPE_CHECKING, Optional
 
 import numpy as np
-import sounddevice as sd
+
+if TYPE_CHECKING:
+    import sounddevice
 
 
 logger = logging.getLogger(__name__)
@@ -17,29 +20,65 @@ class AudioRecorder:
     """Records audio from the microphone using sounddevice.
     
     Uses a callback-based approach where sounddevice handles threading internally.
-    No additional locks needed - the callback appends to a list which is thread-safe
-    for single-producer scenarios.
+    Audio is copied into pre-allocated slabs that are reused across recordings,
+    so the callback does no per-block allocation; a recording longer than one
+    slab chains another slab without copying what was already captured. No
+    additional locks needed - there is a single producer (the callback) and the
+    slabs are only read after the stream is stopped.
     """
     
-    def __init__(self, sample_rate: int = 16000, channels: int = 1):
+    def __init__(
+        self,
+        sample_rate: int = 16000,
+        channels: int = 1,
+        chunk_size: int = 256,
+        slab_seconds: float = 60.0,
+    ):
         """Initialize recorder.
         
         Args:
             sample_rate: Sample rate in Hz (default 16000 for Whisper).
             channels: Number of channels (default 1 for mono).
+            chunk_size: Frames per callback block (smaller = lower latency).
+            slab_seconds: Slab size in seconds (more slabs are chained if exceeded).
         """
         self.sample_rate = sample_rate
         self.channels = channels
-        self._frames: list[np.ndarray] = []
-        self._stream: Optional[sd.InputStream] = None
+        self.chunk_size = chunk_size
+        self._buffer = np.zeros((max(1, int(sample_rate * slab_seconds)), channels), dtype=np.float32)
+        self._write_pos = 0
+        self._slabs: deque[np.ndarray] = deque()
+        self._slab_frames = 0
+        self._status = None
+        self._stream: Optional["sounddevice.InputStream"] = None
         self._recording = False
     
     def _callback(self, indata: np.ndarray, frames: int, time_info, status) -> None:
         """Audio stream callback - called by sounddevice's internal thread."""
         if status:
-            logger.warning(f"Audio status: {status}")
-        if self._recording:
-            self._frames.append(indata.copy())
+            self._status = status  # logged from stop(); no I/O on the audio thread
+        if not self._recording:
+            return
+        
+        pos, n = 0, len(indata)
+        while pos < n:
+            if self._write_pos == len(self._buffer):
+                self._slabs.append(self._buffer)
+                self._slab_frames += len(self._buffer)
+                self._buffer = np.empty_like(self._buffer)
+                self._write_pos = 0
+            take = min(n - pos, len(self._buffer) - self._write_pos)
+            self._buffer[self._write_pos:self._write_pos + take] = indata[pos:pos + take]
+            self._write_pos += take
+            pos += take
+    
+    def _reset(self) -> None:
+        """Rewind to an empty recording, keeping only the first slab."""
+        if self._slabs:
+            self._buffer = self._slabs[0]
+            self._slabs.clear()
+        self._slab_frames = 0
+        self._write_pos = 0
     
     @property
     def is_recording(self) -> bool:
@@ -49,10 +88,18 @@ class AudioRecorder:
     @property
     def duration(self) -> float:
         """Get current recording duration in seconds."""
-        if not self._frames:
-            return 0.0
-        total = sum(len(f) for f in self._frames)
-        return total / self.sample_rate
+        return (self._slab_frames + self._write_pos) / self.sample_rate
+    
+    def preload(self) -> None:
+        """Load sounddevice ahead of the first start().
+        
+        Importing it initializes PortAudio, which would otherwise delay the
+        first recording. Failures are left for start() to report.
+        """
+        try:
+            import sounddevice
+        except Exception as e:
+            logger.warning(f"Could not load audio backend: {e}")
     
     def start(self) -> bool:
         """Start recording.
@@ -64,10 +111,13 @@ class AudioRecorder:
             return False
         
         try:
-            self._frames = []
+            import sounddevice as sd
+            self._reset()
+            self._status = None
             self._stream = sd.InputStream(
                 samplerate=self.sample_rate,
                 channels=self.channels,
+                blocksize=self.chunk_size,
                 dtype=np.float32,
                 callback=self._callback,
             )
@@ -88,18 +138,24 @@ class AudioRecorder:
         if not self._recording:
             return None
         
-        self._recording = False
-        
-        if self._stream:
-            self._stream.stop()
-            self._stream.close()
+        try:
+            if self._stream:
+                # stop() lets pending blocks reach the callback before closing
+                self._stream.stop()
+                self._stream.close()
+        finally:
             self._stream = None
+            self._recording = False
+        
+        if self._status:
+            logger.warning(f"Audio status: {self._status}")
         
-        if not self._frames:
+        if not self._slabs and not self._write_pos:
             return None
         
-        audio = np.concatenate(self._frames, axis=0).flatten()
-        self._frames = []
+        # concatenate() copies, so the slabs can be reused by the next recording
+        audio = np.concatenate([*self._slabs, self._buffer[:self._write_pos]]).ravel()
+        self._reset()
         
         logger.info(f"Recorded {len(audio)/self.sample_rate:.2f}s")
         return audio
@@ -108,8 +164,8 @@ class AudioRecorder:
         """Cancel recording, discarding any data."""
         self._recording = False
         if self._stream:
-            self._stream.stop()
+            # close() aborts without draining; pending blocks are discarded anyway
             self._stream.close()
             self._stream = None
-        self._frames = []
+        self._reset()
         logger.info("Recording cancelled")
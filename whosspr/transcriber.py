@@ -4,14 +4,15 @@ Simple wrapper around OpenAI Whisper for speech-to-text.
 """
 
 import logging
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 import numpy as np
-import torch
-import whisper
 
 from whosspr.config import ModelSize, DeviceType
 
+if TYPE_CHECKING:
+    import whisper
+
 
 logger = logging.getLogger(__name__)
 
@@ -36,6 +37,8 @@ MODEL_NAMES = {
 def get_device(device_type: DeviceType) -> str:
     """Determine the best device for inference."""
     if device_type == DeviceType.AUTO:
+        import torch
+        
         if torch.cuda.is_available():
             return "cuda"
         elif torch.backends.mps.is_available():
@@ -62,26 +65,31 @@ class Transcriber:
         """
         self.model_size = model_size
         self.language = language
-        self._device = get_device(device)
-        self._model: Optional[whisper.Whisper] = None
+        self._device_type = device
+        self._device: Optional[str] = None
+        self._model: Optional["whisper.Whisper"] = None
     
-    def _ensure_model(self) -> whisper.Whisper:
+    def _ensure_model(self) -> "whisper.Whisper":
         """Load model if not already loaded."""
         if self._model is None:
+            import whisper
+            
             name = MODEL_NAMES.get(self.model_size, self.model_size.value)
-            logger.info(f"Loading Whisper model '{name}' on {self._device}")
-            self._model = whisper.load_model(name, device=self._device)
+            logger.info(f"Loading Whisper model '{name}' on {self.device}")
+            self._model = whisper.load_model(name, device=self.device)
             logger.info("Model loaded")
         return self._model
     
     @property
-    def model(self) -> whisper.Whisper:
+    def model(self) -> "whisper.Whisper":
         """Get the loaded model."""
         return self._ensure_model()
     
     @property
     def device(self) -> str:
-        """Get the device being used."""
+        """Get the device being used (resolved on first access)."""
+        if self._device is None:
+            self._device = get_device(self._device_type)
         return self._device
     
     def transcribe(self, audio: np.ndarray) -> str:
@@ -112,5 +120,6 @@ class Transcriber:
             del self._model
             self._model = None
             if self._device == "cuda":
+                import torch
                 torch.cuda.empty_cache()
             logger.info("Model unloaded")